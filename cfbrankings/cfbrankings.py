@@ -1,16 +1,249 @@
+import os
+import re
 import time
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from plugins.base_plugin.base_plugin import BasePlugin
 from utils.http_client import get_http_session
 
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 logger = logging.getLogger(__name__)
 
-ESPN_RANKINGS_URL = "https://site.api.espn.com/apis/site/v2/sports/football/college-football/rankings"
+ESPN_HOST = "https://site.api.espn.com/"
+ESPN_RANKINGS_URL = ESPN_HOST + "apis/site/v2/sports/football/college-football/rankings"
+ESPN_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+TEMPLATE_FILE = "cfbrankings.html"
+STYLESHEET_FILE = "cfbrankings.css"
+CACHE_MAX_ENTRIES = 16
+DISK_CACHE_PATH = Path.home() / ".cache" / "inkypi" / "cfbrankings.json"
+IMAGE_CACHE_MAX_ENTRIES = 4
+POLL_PICKS_MAX_ENTRIES = 16
+FETCH_TIMEOUT = 20
+CONNECT_TIMEOUT = 3.05
+
+# Auto mode prefers earlier kinds when two polls share a timestamp.
+POLL_KINDS = ("cfp", "ap", "coaches")
+DATE_KEYS = ("date", "lastUpdated", "lastUpdate", "updated", "updateDate")
+OCCURRENCE_DATE_KEYS = ("startDate", "endDate")
+MAX_TOP_N = 25
+FONT_SIZES = ("normal", "large", "larger", "largest")
+FALSE_STRINGS = frozenset(("0", "false", "no", "off", ""))
+SCREEN_SIZES = {"800x480": (800, 480), "1600x1200": (1600, 1200)}
+# Fields kept when caching a trimmed copy of the ESPN payload.
+POLL_FIELDS = ("name", "shortName", "type", "headline", "occurrence") + DATE_KEYS
+RANK_FIELDS = ("current", "rank", "position", "ranking", "previous", "recordSummary", "record")
+RANK_KEYS = ("current", "rank", "position", "ranking")
+RECORD_KEYS = ("recordSummary", "record")
+SCHOOL_KEYS = ("shortDisplayName", "location", "displayName", "abbreviation", "name")
+NICKNAME_KEYS = ("name", "nickname")
+RANK_LIST_KEYS = ("items", "entries", "ranks")
+POLL_LIST_KEYS = ("items", "rankings")
+TEAM_FIELDS = ("shortDisplayName", "location", "displayName", "abbreviation", "name", "nickname")
+_ESPN_ISO_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2})(?::(\d{2}))?Z$")
+_KIND_RE = re.compile(r"(?P<cfp>playoff.*committee|selection committee|\bcfp\b)|(?P<coaches>coaches|\bafca\b)|(?P<ap>ap top|\bap\b)")
+
+
+def _first_of(d: Dict[str, Any], keys: Tuple[str, ...], default: Any = "") -> Any:
+    """Return the first truthy d[k] for k in keys, else default."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+
+def _safe_int(v: Any) -> Optional[int]:
+    """Coerce a rank value (int or digit string) to int, else None."""
+    if v is None:
+        return None
+    t = type(v)
+    if t is int:
+        return v
+    if t is str:
+        # isdigit() alone also accepts digits like "²" that int() rejects.
+        if v.isascii() and v.isdigit():
+            return int(v)
+        v = v.strip()
+        return int(v) if v.isascii() and v.isdigit() else None
+    try:
+        return int(v)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _settings_key(settings: Dict[str, Any]) -> Any:
+    """Hashable, order-independent snapshot of a settings dict, for equality checks."""
+    try:
+        # Plain form values (str/int/bool) hash as-is; no sorting or repr needed.
+        return frozenset(settings.items())
+    except TypeError:
+        return tuple(sorted((str(k), repr(v)) for k, v in settings.items()))
+
+
+def _as_list(obj: Any, keys: Tuple[str, ...]) -> List[Any]:
+    """Unwrap a list that ESPN may nest under one of keys; [] if there is none."""
+    if isinstance(obj, dict):
+        obj = _first_of(obj, keys, None)
+    return obj if isinstance(obj, list) else []
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(value: str) -> Optional[datetime]:
+    m = _ESPN_ISO_RE.match(value)
+    if m:
+        # ESPN's usual "2025-11-18T21:30Z" shape: build the datetime directly.
+        year, month, day, hour, minute, second = m.groups()
+        try:
+            return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second or 0), tzinfo=timezone.utc)
+        except ValueError:
+            return None
+    try:
+        if parse_datetime is not None:
+            dt = parse_datetime(value)
+        else:
+            if value.endswith("Z"):
+                value = value[:-1] + "+00:00"
+            dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@functools.lru_cache(maxsize=8)
+def _tz_for(name: str):
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _format_local(date_str: str, tz_name: Optional[str]) -> str:
+    """Render an ISO timestamp as e.g. "Nov 18, 2025 4:30 PM EST" in tz_name."""
+    dt = _parse_iso(date_str)
+    if dt is None:
+        return date_str
+    tzinfo = _tz_for(tz_name) if tz_name else None
+    try:
+        dt_local = dt.astimezone(tzinfo) if tzinfo else dt.astimezone()
+        date_part = dt_local.strftime("%b %d, %Y")
+        hour = dt_local.hour % 12 or 12
+        ampm = "AM" if dt_local.hour < 12 else "PM"
+        tz_abbr = (dt_local.tzname() or "").strip()
+        time_part = f"{hour}:{dt_local.minute:02d} {ampm}" + (f" {tz_abbr}" if tz_abbr else "")
+        return f"{date_part} {time_part}"
+    except Exception:
+        return date_str
+
+
+@functools.lru_cache(maxsize=512)
+def _iso_to_ts(value: str) -> Optional[float]:
+    dt = _parse_iso(value)
+    return dt.timestamp() if dt is not None else None
+
+
+def _poll_timestamp(poll: Dict[str, Any]) -> float:
+    for source, keys in ((poll, DATE_KEYS), (poll.get("occurrence"), OCCURRENCE_DATE_KEYS)):
+        if not isinstance(source, dict):
+            continue
+        for k in keys:
+            v = source.get(k)
+            if v:
+                ts = _iso_to_ts(v if isinstance(v, str) else str(v))
+                if ts is not None:
+                    return ts
+    return 0.0
+
+
+def _poll_kind(poll: Dict[str, Any]) -> str:
+    """Classify a poll as "cfp", "ap", "coaches" or "" (unknown)."""
+    t = str(poll.get("type") or "").strip().lower()
+    if t in POLL_KINDS:
+        return t
+    blob = " ".join(str(poll.get(k) or "") for k in ("name", "shortName", "headline")).lower()
+    m = _KIND_RE.search(blob)
+    return m.lastgroup if m else ""
+
+
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    poll: str
+    top_n: int
+    font_size: str
+    show_record: bool
+    show_movement: bool
+    show_nickname: bool
+    show_meta: bool
+    compact_mode: bool
+    color_logos: bool
+    cache_minutes: int
+    screen_size: str
+
+
+class Row(NamedTuple):
+    """One ranked team as the template reads it (r.rank, r.school, ...)."""
+    rank: Any
+    school: str
+    nickname: str
+    logo: str
+    record: str
+    move_dir: str
+    move_delta: int
+
 
 class CfbRankings(BasePlugin):
-    _cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+    _last_settings: Optional[Tuple[Any, "_Settings"]] = None
+    # (settings key, dimensions, tz name), payload, image of the previous render
+    _last_render: Optional[Tuple[Any, Any, Any]] = None
+
+    def __init__(self, config, **dependencies):
+        super().__init__(config, **dependencies)
+        # url -> (fetched_at monotonic, data, etag, last_modified); bounded LRU
+        self._cache: "OrderedDict[str, Tuple[float, Any, Optional[str], Optional[str]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        # (id(payload), poll choice) -> (payload, picked poll)
+        self._poll_picks: Dict[Tuple[int, str], Tuple[Any, Optional[Dict[str, Any]]]] = {}
+        # render-input digest -> rendered image; polls change weekly, so repeat draws hit
+        self._img_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._img_cache_lock = threading.Lock()
+        self._load_disk_cache()
+        env = getattr(self, "env", None)
+        if env is not None:
+            # The template ships with the plugin and never changes at runtime:
+            # compile it once up front and skip Jinja's per-render mtime check.
+            env.auto_reload = False
+            try:
+                env.get_template(TEMPLATE_FILE)
+            except Exception:
+                logger.warning("Could not precompile %s", TEMPLATE_FILE, exc_info=True)
 
     def generate_settings_template(self):
         params = super().generate_settings_template()
@@ -18,25 +251,22 @@ class CfbRankings(BasePlugin):
         return params
 
     def generate_image(self, settings: Dict[str, Any], device_config):
-        poll_choice = (settings.get("poll") or "auto").strip().lower()
-        top_n = max(1, min(25, int(settings.get("top_n") or 20)))
-        font_size = (settings.get("font_size") or "normal").strip().lower()
-        if font_size not in ("normal", "large", "larger", "largest"):
-            font_size = "normal"
+        cfg = self._parse_settings(settings)
+        poll_choice = cfg.poll
+        top_n = cfg.top_n
+        show_record = cfg.show_record
+        ttl = cfg.cache_minutes * 60
 
-        show_record = self._to_bool(settings.get("show_record", True))
-        show_movement = self._to_bool(settings.get("show_movement", True))
-        show_nickname = self._to_bool(settings.get("show_nickname", True))
-        show_meta = self._to_bool(settings.get("show_meta", True))
-        compact_mode = self._to_bool(settings.get("compact_mode", False))
-        color_logos = self._to_bool(settings.get("color_logos", True))
-        cache_minutes = max(0, min(1440, int(settings.get("cache_minutes") or 30)))
-        ttl = cache_minutes * 60
-
-        dimensions = self._get_dimensions(settings, device_config)
+        dimensions = self._get_dimensions(cfg.screen_size, device_config)
         two_column = top_n > 15
 
         data = self._get_rankings_cached(ttl)
+        # Same settings, device and payload object as last time: nothing to rebuild.
+        render_key = (_settings_key(settings), dimensions, self._get_tz_name(device_config))
+        last = self._last_render
+        if last is not None and last[0] == render_key and last[1] is data and last[2] is not None:
+            return last[2].copy()
+
         poll = self._pick_polls(data, poll_choice)
         if poll is None:
             if poll_choice == "cfp":
@@ -45,11 +275,11 @@ class CfbRankings(BasePlugin):
 
         poll_name = (poll.get("name") or poll.get("shortName") or "College Football Rankings").strip()
         title = poll_name
-        ranks = self._extract_ranks(poll)
+        ranks = self._extract_ranks(poll, top_n)
         rows = self._build_rows(ranks, top_n, show_record)
 
         meta = ""
-        if show_meta:
+        if cfg.show_meta:
             season = (data.get("season") or {}).get("year")
             week = (data.get("week") or {}).get("number")
             if season and week:
@@ -64,194 +294,342 @@ class CfbRankings(BasePlugin):
             "meta": meta,
             "poll_date": poll_date,
             "rows": rows,
-            "show_record": bool(show_record),
-            "show_movement": bool(show_movement),
-            "show_nickname": bool(show_nickname),
-            "compact_mode": bool(compact_mode),
+            "show_record": cfg.show_record,
+            "show_movement": cfg.show_movement,
+            "show_nickname": cfg.show_nickname,
+            "compact_mode": cfg.compact_mode,
             "two_column": two_column,
             "top_n": top_n,
-            "font_size": font_size,
-            "color_logos": bool(color_logos),
+            "font_size": cfg.font_size,
+            "color_logos": cfg.color_logos,
             "plugin_settings": settings,
         }
-        return self.render_image(dimensions, "cfbrankings.html", "cfbrankings.css", template_params)
-
-    def _get_rankings_cached(self, ttl: int) -> Dict[str, Any]:
-        now = time.time()
-        if ttl > 0 and self._cache["data"] is not None and (now - self._cache["ts"]) < ttl:
-            return self._cache["data"]
-        session = get_http_session()
-        resp = session.get(ESPN_RANKINGS_URL, timeout=20)
-        resp.raise_for_status()
-        data = resp.json()
-        if ttl > 0:
-            self._cache["ts"] = now
-            self._cache["data"] = data
-        return data
-
-    def _pick_polls(self, data: Dict[str, Any], choice: str) -> Optional[Dict[str, Any]]:
-        polls = data.get("rankings")
-        if isinstance(polls, dict):
-            polls = polls.get("items") or polls.get("rankings")
-        if not isinstance(polls, list):
+        image = self._render_cached(dimensions, template_params)
+        if image is None:
+            # Keep the previous memo so the next call renders again.
             return None
+        self._last_render = (render_key, data, image)
+        return image.copy()
+
+    def _render_cached(self, dimensions: Tuple[int, int], template_params: Dict[str, Any]):
+        # Returns the cached image itself; callers hand out copies.
+        settings = template_params["plugin_settings"]
+        inputs = (
+            dimensions,
+            sorted((k, v) for k, v in template_params.items() if k != "plugin_settings"),
+            sorted((str(k), repr(v)) for k, v in settings.items()),
+        )
+        key = hashlib.blake2b(repr(inputs).encode(), digest_size=16).digest()
+        with self._img_cache_lock:
+            image = self._img_cache.get(key)
+            if image is not None:
+                self._img_cache.move_to_end(key)
+        if image is not None:
+            return image
+
+        image = self.render_image(dimensions, TEMPLATE_FILE, STYLESHEET_FILE, template_params)
+        if image is None:
+            # Failed render: don't cache it, so the next call tries again.
+            return None
+        with self._img_cache_lock:
+            self._img_cache[key] = image
+            while len(self._img_cache) > IMAGE_CACHE_MAX_ENTRIES:
+                self._img_cache.popitem(last=False)
+        return image
+
+    def _parse_settings(self, settings: Dict[str, Any]) -> "_Settings":
+        # Settings rarely change between refreshes; reuse the last parse when identical.
+        key = _settings_key(settings)
+        last = self._last_settings
+        if last is not None and last[0] == key:
+            return last[1]
 
-        def norm(s: Any) -> str:
-            return str(s or "").strip().lower()
+        font_size = (settings.get("font_size") or "normal").strip().lower()
+        if font_size not in FONT_SIZES:
+            font_size = "normal"
+        cfg = _Settings(
+            poll=(settings.get("poll") or "auto").strip().lower(),
+            top_n=max(1, min(MAX_TOP_N, int(settings.get("top_n") or 20))),
+            font_size=font_size,
+            show_record=self._to_bool(settings.get("show_record", True)),
+            show_movement=self._to_bool(settings.get("show_movement", True)),
+            show_nickname=self._to_bool(settings.get("show_nickname", True)),
+            show_meta=self._to_bool(settings.get("show_meta", True)),
+            compact_mode=self._to_bool(settings.get("compact_mode", False)),
+            color_logos=self._to_bool(settings.get("color_logos", True)),
+            cache_minutes=max(0, min(1440, int(settings.get("cache_minutes") or 30))),
+            screen_size=(settings.get("screen_size") or "auto").strip().lower(),
+        )
+        self._last_settings = (key, cfg)
+        return cfg
 
-        def parse_date(p: Dict[str, Any]) -> float:
-            import datetime
-            for k in ("date", "lastUpdated", "lastUpdate", "updated", "updateDate"):
-                v = p.get(k)
-                if not v:
+    def _get_rankings_cached(self, ttl: int) -> Dict[str, Any]:
+        return self._fetch_json_cached(ESPN_RANKINGS_URL, ttl)
+
+    def _fetch_json_cached(self, url: str, ttl: int) -> Dict[str, Any]:
+        if ttl <= 0:
+            return self._fetch_coalesced(url, store=False)
+        with self._cache_lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                self._cache.move_to_end(url)
+        if entry is not None and (time.monotonic() - entry[0]) < ttl:
+            return entry[1]
+        try:
+            # Expired entries are revalidated inline; an unchanged poll is a cheap 304.
+            return self._fetch_coalesced(url, store=True)
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning("Refreshing %s failed; using cached rankings", url, exc_info=True)
+            return entry[1]
+
+    def _fetch_coalesced(self, url: str, store: bool) -> Dict[str, Any]:
+        # Concurrent misses for the same URL share a single HTTP request.
+        with self._cache_lock:
+            event = self._inflight.get(url)
+            leader = event is None
+            if leader:
+                event = self._inflight[url] = threading.Event()
+        if not leader:
+            event.wait(FETCH_TIMEOUT)
+            if store:
+                with self._cache_lock:
+                    entry = self._cache.get(url)
+                if entry is not None:
+                    return entry[1]
+            # With caching off the leader stored nothing; don't serve an old entry.
+            return self._download(url)[0]
+        try:
+            previous = None
+            if store:
+                with self._cache_lock:
+                    previous = self._cache.get(url)
+            result = self._download(url, previous)
+            if result is None:
+                # 304 Not Modified: keep the cached body and validators.
+                _, data, etag, last_modified = previous
+            else:
+                data, etag, last_modified = result
+            if store:
+                with self._cache_lock:
+                    if result is not None:
+                        self._poll_picks.clear()
+                    self._cache[url] = (time.monotonic(), data, etag, last_modified)
+                    self._cache.move_to_end(url)
+                    while len(self._cache) > CACHE_MAX_ENTRIES:
+                        self._cache.popitem(last=False)
+                if result is not None:
+                    self._save_disk_cache()
+            return data
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(url, None)
+            event.set()
+
+    def _load_disk_cache(self) -> None:
+        """Seed the HTTP cache from the last process's snapshot, if any.
+
+        Entries keep their original age, so an expired snapshot is revalidated
+        on first use like any other expired entry.
+        """
+        try:
+            blob = _json.loads(DISK_CACHE_PATH.read_bytes())
+        except FileNotFoundError:
+            return
+        except Exception:
+            logger.warning("Ignoring unreadable cache file %s", DISK_CACHE_PATH, exc_info=True)
+            return
+        now_wall, now_mono = time.time(), time.monotonic()
+        if not isinstance(blob, dict):
+            logger.warning("Ignoring malformed cache file %s", DISK_CACHE_PATH)
+            return
+        with self._cache_lock:
+            for url, entry in blob.items():
+                try:
+                    age = max(0.0, now_wall - float(entry["ts"]))
+                    data = entry["data"]
+                except (KeyError, TypeError, ValueError):
                     continue
+                if not isinstance(data, dict):
+                    continue
+                self._cache[url] = (now_mono - age, data, entry.get("etag"), entry.get("last_modified"))
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _save_disk_cache(self) -> None:
+        now_wall, now_mono = time.time(), time.monotonic()
+        with self._cache_lock:
+            blob = {
+                url: {"ts": now_wall - (now_mono - fetched_at), "data": data, "etag": etag, "last_modified": last_modified}
+                for url, (fetched_at, data, etag, last_modified) in self._cache.items()
+            }
+        tmp_name = None
+        try:
+            payload = _json.dumps(blob)
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer keeps concurrent saves from
+            # replacing each other's half-written file; the last one wins.
+            with tempfile.NamedTemporaryFile(dir=DISK_CACHE_PATH.parent, prefix=".cfbrankings-", delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(payload)
+            os.replace(tmp_name, DISK_CACHE_PATH)
+        except Exception:
+            logger.warning("Could not write cache file %s", DISK_CACHE_PATH, exc_info=True)
+            if tmp_name is not None:
                 try:
-                    ds = str(v).replace("Z", "+00:00")
-                    dt = datetime.datetime.fromisoformat(ds)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=datetime.timezone.utc)
-                    return dt.timestamp()
-                except Exception:
+                    os.unlink(tmp_name)
+                except OSError:
                     pass
-            occ = p.get("occurrence")
-            if isinstance(occ, dict):
-                for k in ("startDate", "endDate"):
-                    v = occ.get(k)
-                    if not v:
-                        continue
-                    try:
-                        ds = str(v).replace("Z", "+00:00")
-                        dt = datetime.datetime.fromisoformat(ds)
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=datetime.timezone.utc)
-                        return dt.timestamp()
-                    except Exception:
-                        pass
-            return 0.0
-
-        def is_ap(p: Dict[str, Any]) -> bool:
-            t = norm(p.get("type"))
-            if t == "ap":
-                return True
-            n = norm(p.get("name"))
-            s = norm(p.get("shortName"))
-            return ("ap" in s) or ("ap top" in n)
-
-        def is_coaches(p: Dict[str, Any]) -> bool:
-            t = norm(p.get("type"))
-            if t == "coaches":
-                return True
-            n = norm(p.get("name"))
-            s = norm(p.get("shortName"))
-            return ("coaches" in n) or ("afca" in n) or ("coaches" in s)
-
-        def is_cfp(p: Dict[str, Any]) -> bool:
-            n = norm(p.get("name"))
-            if n == "playoff selection committee rankings":
-                return True
-            if "playoff selection committee" in n:
-                return True
-            s = norm(p.get("shortName"))
-            t = norm(p.get("type"))
-            h = norm(p.get("headline"))
-            blob = " ".join([n, s, t, h])
-            return ("playoff" in blob and "committee" in blob) or ("cfp" in blob) or ("selection committee" in blob)
-
-        ap_list = [p for p in polls if isinstance(p, dict) and is_ap(p)]
-        coaches_list = [p for p in polls if isinstance(p, dict) and is_coaches(p)]
-        cfp_list = [p for p in polls if isinstance(p, dict) and is_cfp(p)]
-
-        ap_list.sort(key=parse_date, reverse=True)
-        coaches_list.sort(key=parse_date, reverse=True)
-        cfp_list.sort(key=parse_date, reverse=True)
-
-        if choice == "cfp":
-            return cfp_list[0] if cfp_list else None
-        if choice == "ap":
-            return ap_list[0] if ap_list else None
-        if choice == "coaches":
-            return coaches_list[0] if coaches_list else None
-
-        candidates: List[Dict[str, Any]] = []
-        if cfp_list:
-            candidates.append(cfp_list[0])
-        if ap_list:
-            candidates.append(ap_list[0])
-        if coaches_list:
-            candidates.append(coaches_list[0])
+
+    def _download(self, url: str, previous=None) -> Optional[Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+        """GET url, revalidating against a previous cache entry if given.
+
+        Returns (data, etag, last_modified), or None when the server answers
+        304 Not Modified.
+        """
+        headers = dict(ESPN_HEADERS)
+        if previous is not None:
+            _, _, etag, last_modified = previous
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        resp = get_http_session().get(url, headers=headers, timeout=(CONNECT_TIMEOUT, FETCH_TIMEOUT))
+        if resp.status_code == 304 and previous is not None:
+            return None
+        resp.raise_for_status()
+        return (
+            self._slim_payload(_json.loads(resp.content)),
+            resp.headers.get("ETag"),
+            resp.headers.get("Last-Modified"),
+        )
+
+    def _slim_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Project the ESPN response down to the fields rendering reads.
+
+        The raw payload carries every poll's full team objects (links, colors,
+        alternate logos, ...); caching only what we use keeps the resident
+        cache small on low-memory devices.
+        """
+        if not isinstance(data, dict):
+            return {}
+        polls = _as_list(data.get("rankings"), POLL_LIST_KEYS)
+
+        slim_polls = []
+        for poll in polls:
+            if not isinstance(poll, dict):
+                continue
+            slim = {k: poll[k] for k in POLL_FIELDS if k in poll}
+            slim["ranks"] = [self._slim_rank(r) for r in self._extract_ranks(poll)]
+            slim_polls.append(slim)
+
+        out: Dict[str, Any] = {"rankings": slim_polls}
+        season = data.get("season")
+        if isinstance(season, dict):
+            out["season"] = {"year": season.get("year")}
+        week = data.get("week")
+        if isinstance(week, dict):
+            out["week"] = {"number": week.get("number")}
+        return out
+
+    def _slim_rank(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        slim = {k: entry[k] for k in RANK_FIELDS if k in entry}
+        for key in ("team", "school"):
+            team = entry.get(key)
+            if not isinstance(team, dict):
+                continue
+            slim_team = {k: team[k] for k in TEAM_FIELDS if k in team}
+            logos = team.get("logos")
+            if isinstance(logos, list):
+                slim_team["logos"] = [
+                    {"href": item.get("href"), "rel": item.get("rel")}
+                    for item in logos
+                    if isinstance(item, dict) and item.get("href")
+                ]
+            slim[key] = slim_team
+        return slim
+
+    def _pick_polls(self, data: Dict[str, Any], choice: str) -> Optional[Dict[str, Any]]:
+        # Cached payloads are reused as-is within the TTL, so the pick for a
+        # given payload object never changes. Holding a reference to data
+        # keeps its id() from being recycled while the memo entry lives.
+        key = (id(data), choice)
+        hit = self._poll_picks.get(key)
+        if hit is not None and hit[0] is data:
+            return hit[1]
+        poll = self._select_poll(data, choice)
+        if len(self._poll_picks) >= POLL_PICKS_MAX_ENTRIES:
+            self._poll_picks.clear()
+        self._poll_picks[key] = (data, poll)
+        return poll
+
+    def _select_poll(self, data: Dict[str, Any], choice: str) -> Optional[Dict[str, Any]]:
+        polls = _as_list(data.get("rankings"), POLL_LIST_KEYS)
+
+        # Classify each poll once and reuse the result for every branch below.
+        kinds = [(p, _poll_kind(p)) for p in polls if isinstance(p, dict)]
+
+        if choice in POLL_KINDS:
+            matches = [p for p, k in kinds if k == choice]
+            if len(matches) <= 1:
+                # Nothing to compare, so skip date parsing entirely.
+                return matches[0] if matches else None
+            return max(matches, key=_poll_timestamp)
+
+        known = [(p, k) for p, k in kinds if k]
+        if len(known) == 1:
+            return known[0][0]
+
+        # Auto: newest poll of each kind in one pass, timestamping each poll once.
+        newest: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        for p, k in known:
+            ts = _poll_timestamp(p)
+            if k not in newest or ts > newest[k][0]:
+                newest[k] = (ts, p)
+        candidates = [newest[k] for k in POLL_KINDS if k in newest]
         if not candidates:
             return polls[0] if polls and isinstance(polls[0], dict) else None
-        candidates.sort(key=parse_date, reverse=True)
-        return candidates[0]
-
-    def _extract_ranks(self, poll: Dict[str, Any]) -> List[Dict[str, Any]]:
-        ranks = poll.get("ranks")
-        if isinstance(ranks, dict):
-            ranks = ranks.get("items") or ranks.get("entries") or ranks.get("ranks")
-        if not isinstance(ranks, list):
-            ranks = poll.get("entries") or []
-        if not isinstance(ranks, list):
-            ranks = []
-        return [r for r in ranks if isinstance(r, dict)]
-
-    def _get_tzinfo(self, device_config):
-        try:
-            tz_name = device_config.get_config("timezone")
-        except Exception:
-            tz_name = None
-        if not tz_name:
-            return None
+        return max(candidates, key=lambda c: c[0])[1]
+
+    def _extract_ranks(self, poll: Dict[str, Any], limit: int = MAX_TOP_N) -> List[Dict[str, Any]]:
+        ranks = _as_list(poll.get("ranks"), RANK_LIST_KEYS) or _as_list(poll.get("entries"), RANK_LIST_KEYS)
+        out = []
+        for r in ranks:
+            if isinstance(r, dict):
+                out.append(r)
+                if len(out) >= limit:
+                    break
+        return out
+
+    def _get_tz_name(self, device_config) -> Optional[str]:
         try:
-            from zoneinfo import ZoneInfo
-            return ZoneInfo(tz_name)
+            return device_config.get_config("timezone") or None
         except Exception:
             return None
 
     def _format_poll_date(self, poll: Dict[str, Any], device_config) -> str:
-        from datetime import datetime, timezone
         date_str = None
-        for k in ("date", "lastUpdated", "lastUpdate", "updated", "updateDate"):
+        for k in DATE_KEYS:
             v = poll.get(k)
             if v:
                 date_str = str(v)
                 break
         if not date_str:
             return ""
-        tzinfo = self._get_tzinfo(device_config)
-        try:
-            ds = date_str.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(ds)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            dt_local = dt.astimezone(tzinfo) if tzinfo else dt.astimezone()
-            date_part = dt_local.strftime("%b %d, %Y")
-            hour = dt_local.strftime("%I").lstrip("0") or "12"
-            minute = dt_local.strftime("%M")
-            ampm = dt_local.strftime("%p")
-            tz_abbr = (dt_local.strftime("%Z") or "").strip()
-            time_part = f"{hour}:{minute} {ampm}" + (f" {tz_abbr}" if tz_abbr else "")
-            return f"{date_part} {time_part}"
-        except Exception:
-            return date_str
-
-    def _build_rows(self, ranks: List[Dict[str, Any]], top_n: int, show_record: bool):
-        rows = []
+        return _format_local(date_str, self._get_tz_name(device_config))
 
-        def _to_int(x):
-            try:
-                if x is None:
-                    return None
-                if isinstance(x, str) and not x.strip().isdigit():
-                    return None
-                return int(x)
-            except Exception:
-                return None
+    def _build_rows(self, ranks: List[Dict[str, Any]], top_n: int, show_record: bool) -> List["Row"]:
+        rows: List[Row] = []
 
         for entry in ranks[:top_n]:
-            rk = entry.get("current") or entry.get("rank") or entry.get("position") or entry.get("ranking")
-            prev = entry.get("previous")
-            cur_i = _to_int(rk)
-            prev_i = _to_int(prev)
+            get = entry.get
+            rk = _first_of(entry, RANK_KEYS, None)
+            prev = get("previous")
+            cur_i = _safe_int(rk)
+            prev_i = _safe_int(prev)
             move_dir = ""
             move_delta = 0
             if cur_i is not None and prev_i is not None and cur_i != prev_i:
@@ -262,76 +640,62 @@ class CfbRankings(BasePlugin):
                     move_dir = "down"
                     move_delta = cur_i - prev_i
 
-            team = entry.get("team") or entry.get("school") or {}
+            team = get("team") or get("school") or {}
             if not isinstance(team, dict):
                 team = {}
-            school = (
-                team.get("shortDisplayName")
-                or team.get("location")
-                or team.get("displayName")
-                or team.get("abbreviation")
-                or team.get("name")
-                or "Unknown"
-            )
-            nickname = team.get("name") or team.get("nickname") or ""
+            school = _first_of(team, SCHOOL_KEYS, "Unknown")
+            nickname = _first_of(team, NICKNAME_KEYS)
+            # Only show the nickname when the school name doesn't already contain it.
             nick_out = ""
-            if nickname and nickname.lower() not in str(school).lower():
+            if nickname and nickname != school and nickname.lower() not in str(school).lower():
                 nick_out = nickname
 
+            # Prefer the "default" logo, else the first one with an href.
             logo = ""
             logos = team.get("logos")
-            if isinstance(logos, list) and logos:
-                href = None
+            if isinstance(logos, list):
                 for item in logos:
                     if not isinstance(item, dict):
                         continue
+                    href = item.get("href")
+                    if not href:
+                        continue
                     rel = item.get("rel")
-                    if isinstance(rel, list) and "default" in rel and item.get("href"):
-                        href = item.get("href")
+                    if isinstance(rel, list) and "default" in rel:
+                        logo = href
                         break
-                if not href:
-                    for item in logos:
-                        if isinstance(item, dict) and item.get("href"):
-                            href = item.get("href")
-                            break
-                logo = href or ""
-
-            rec = entry.get("recordSummary") or entry.get("record") or ""
-            rows.append({
-                "rank": rk if rk is not None else "--",
-                "school": school,
-                "nickname": nick_out,
-                "logo": logo,
-                "record": rec if show_record else "",
-                "move_dir": move_dir,
-                "move_delta": move_delta,
-            })
+                    if not logo:
+                        logo = href
+
+            rec = _first_of(entry, RECORD_KEYS)
+            rows.append(Row(
+                rank=rk if rk is not None else "--",
+                school=school,
+                nickname=nick_out,
+                logo=logo,
+                record=rec if show_record else "",
+                move_dir=move_dir,
+                move_delta=move_delta,
+            ))
         return rows
 
-    def _get_dimensions(self, settings: Dict[str, Any], device_config) -> Tuple[int, int]:
-        screen_size = (settings.get("screen_size") or "auto").strip().lower()
-        if screen_size == "800x480":
-            dims = (800, 480)
-        elif screen_size == "1600x1200":
-            dims = (1600, 1200)
-        else:
-            dims = device_config.get_resolution()
+    def _get_dimensions(self, screen_size: str, device_config) -> Tuple[int, int]:
+        dims = SCREEN_SIZES.get(screen_size) or device_config.get_resolution()
         if device_config.get_config("orientation") == "vertical":
             dims = dims[::-1]
         return dims
 
     def _to_bool(self, v: Any) -> bool:
-        if isinstance(v, bool):
+        if v is True or v is False:
             return v
         if v is None:
             return False
         if isinstance(v, (list, tuple)) and v:
             v = v[-1]
         if isinstance(v, str):
-            s = v.strip().lower()
-            if s in ("1", "true", "yes", "on", "checked"):
-                return True
-            if s in ("0", "false", "no", "off", ""):
+            # Anything not recognisably "off" counts as on. Form values are
+            # normally already canonical, so try them before normalizing.
+            if v in FALSE_STRINGS:
                 return False
-            return True
+            return v.strip().lower() not in FALSE_STRINGS
         return bool(v)